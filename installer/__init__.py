@@ -6,17 +6,19 @@ Cross-platform installation system for Windows, macOS, and Linux.
 Modules:
 - install.py - CLI installer with automated setup
 - install_gui.py - GUI installer with modern interface
+- launch.py - Universal launcher (auto GUI/CLI)
+- launch_daemon.py - Opt-in warm launch daemon for repeated runs
+- build_pyz.py - Builds the single-file coditect-install.pyz
 - install.sh - Bash installer (Unix/Linux/macOS only)
 
 Usage:
     # GUI installer (recommended for users)
-    python3 -m installer.gui
+    python3 -m installer.install_gui
 
     # CLI installer (recommended for automation)
-    python3 -m installer.cli
+    python3 -m installer.install
 
     # Direct execution
-    python3 scripts/installer/install_gui.py
     python3 scripts/installer/install.py
 
 Author: AZ1.AI CODITECT Team
@@ -28,4 +30,11 @@ __version__ = "1.0.0"
 __author__ = "AZ1.AI CODITECT Team"
 __all__ = ["CrossPlatformInstaller"]
 
-from .install import CrossPlatformInstaller
+
+def __getattr__(name):
+    # Imported on first use, so importing the package (as the zipapp's
+    # launcher does) stays cheap
+    if name == "CrossPlatformInstaller":
+        from .install import CrossPlatformInstaller
+        return CrossPlatformInstaller
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
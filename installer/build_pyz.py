@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+CODITECT Installer Zipapp Builder
+
+Bundles the installer package into a single executable archive
+(coditect-install.pyz) that runs the universal launcher.
+
+Features:
+- One file to ship: launcher, CLI and GUI installers in a zipapp
+- Byte-compiled modules included, so no compile step at startup
+- Keeps the installer/ package layout (relative imports keep working)
+
+Usage:
+    # Build coditect-install.pyz in the project root
+    python3 scripts/installer/build_pyz.py
+
+    # Build to a custom location
+    python3 scripts/installer/build_pyz.py -o dist/coditect-install.pyz
+
+    # Run it (the archive's directory is the project root, next to requirements.txt)
+    ./coditect-install.pyz --gui
+    python3 coditect-install.pyz --cli --venv-only
+
+Author: AZ1.AI CODITECT Team
+Date: 2026-10-15
+"""
+
+import os
+import py_compile
+import shutil
+import sys
+import tempfile
+import zipapp
+from pathlib import Path
+
+INSTALLER_DIR = Path(__file__).parent.absolute()
+DEFAULT_OUTPUT = INSTALLER_DIR.parent / "coditect-install.pyz"
+INTERPRETER = "/usr/bin/env python3"
+
+# Development-only modules left out of the archive
+EXCLUDED_MODULES = frozenset({"build_pyz.py"})
+
+# zipapp's generated __main__ drops the return value, so exit codes are lost
+ARCHIVE_MAIN = """import sys
+from installer.launch import run_launcher
+
+sys.exit(run_launcher())
+"""
+
+
+def stage_package(staging: Path) -> None:
+    """Copy the installer modules into staging/installer with their bytecode"""
+    package_dir = staging / "installer"
+    package_dir.mkdir()
+    for source in sorted(INSTALLER_DIR.glob("*.py")):
+        if source.name in EXCLUDED_MODULES:
+            continue
+        target = package_dir / source.name
+        shutil.copy2(source, target)
+        # zipimport cannot write __pycache__, but it does load a .pyc stored
+        # next to its source (used when the running Python's magic matches)
+        py_compile.compile(
+            str(target), cfile=str(target) + "c", doraise=True,
+            invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH
+        )
+    (staging / "__main__.py").write_text(ARCHIVE_MAIN, encoding="utf-8")
+
+
+def build(output: Path) -> Path:
+    """Build the zipapp and return its path"""
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix="coditect-pyz-") as tmp:
+        staging = Path(tmp)
+        stage_package(staging)
+        zipapp.create_archive(
+            staging, target=output, interpreter=INTERPRETER, compressed=True
+        )
+    return output
+
+
+def main():
+    """Entry point for the zipapp builder"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Build the CODITECT installer zipapp'
+    )
+    parser.add_argument(
+        '-o', '--output',
+        type=Path,
+        default=DEFAULT_OUTPUT,
+        help=f'Archive to write (default: {DEFAULT_OUTPUT.name} in the project root)'
+    )
+    args = parser.parse_args()
+
+    try:
+        output = build(args.output.absolute())
+    except (OSError, py_compile.PyCompileError) as e:
+        print(f"Error: Failed to build installer archive: {e}", file=sys.stderr)
+        return 1
+
+    size_kb = os.path.getsize(output) / 1024
+    print(f"Built {output} ({size_kb:.1f} KB, Python {sys.version_info.major}.{sys.version_info.minor} bytecode)")
+    print("The installer treats the directory holding the archive as the project root.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
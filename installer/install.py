@@ -10,6 +10,10 @@ Usage:
     python3 scripts/install.py              # Full installation
     python3 scripts/install.py --venv-only  # Only create venv
     python3 scripts/install.py --deps-only  # Only install dependencies
+    python3 scripts/install.py --force      # Recreate an existing venv
+
+    # Seed the wheelhouse so later installs of pinned requirements skip the network
+    pip download -d ~/.cache/coditect/wheelhouse -r requirements.txt
 
 Author: AZ1.AI CODITECT Team
 Sprint: Sprint +1 Week 2
@@ -21,8 +25,53 @@ import sys
 import subprocess
 import platform
 import shutil
+import stat
+import hashlib
+import queue
+import re
+import tarfile
+import threading
+import time
+import urllib.request
+import venv
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
+
+# Optional: zstd-compressed venv cache archives (plain tar otherwise)
+try:
+    import zstandard
+    ZstdError = zstandard.ZstdError
+except ImportError:
+    zstandard = None
+    ZstdError = OSError
+
+# Python 3.7 lacks cached_property; an uncached property is enough for the
+# installer to get as far as reporting the version requirement
+try:
+    from functools import cached_property
+except ImportError:
+    cached_property = property
+
+# Standalone pip zipapp used to bootstrap pip into new venvs
+PIP_PYZ_URL = "https://bootstrap.pypa.io/pip/pip.pyz"
+
+# Seconds to wait on the pip.pyz server before falling back to ensurepip
+PIP_PYZ_TIMEOUT = 15
+
+# "name==version" (optionally with extras) in requirements.txt
+PINNED_REQUIREMENT = re.compile(r'^([A-Za-z0-9][A-Za-z0-9._-]*)(?:\[[^\]]*\])?\s*==\s*([A-Za-z0-9.!+_-]+)$')
+
+# Directories renamed by discard_tree() while their deletion is pending
+DISCARDED_TREE = re.compile(r'^\.old\.\d+\.\d+\.')
+
+# Written into a shared venv once its dependencies are fully installed
+VENV_COMPLETE_MARKER = ".coditect-complete"
+
+# Venv archives hold absolute interpreter symlinks, which the 'data' filter
+# (the default from Python 3.14) rejects; 'tar' still keeps members inside
+# the destination. Pythons without extraction filters take no argument.
+TAR_EXTRACT_KWARGS = {'filter': 'tar'} if hasattr(tarfile, 'data_filter') else {}
 
 # Colors for terminal output (cross-platform)
 class Colors:
@@ -36,62 +85,395 @@ class Colors:
     NC = '\033[0m'  # No Color
 
     @classmethod
-    def disable_on_windows(cls):
-        """Disable colors on Windows if not supported"""
-        if platform.system() == 'Windows' and not os.environ.get('ANSICON'):
-            for attr in dir(cls):
-                if not attr.startswith('_') and attr != 'disable_on_windows':
-                    setattr(cls, attr, '')
+    def disable(cls):
+        """Disable colors (output is not a color-capable terminal)"""
+        cls.RED = cls.GREEN = cls.YELLOW = cls.BLUE = cls.CYAN = cls.BOLD = cls.NC = ''
+
+
+def supports_color() -> bool:
+    """Check whether stdout can render ANSI colors, enabling them on Windows"""
+    if os.environ.get('NO_COLOR'):
+        return False
+    if sys.stdout is None or not sys.stdout.isatty():
+        return False
+    if platform.system() != 'Windows':
+        return True
+    if os.environ.get('ANSICON'):
+        return True
+
+    # Windows 10+ consoles understand ANSI once virtual terminal processing is on
+    try:
+        import ctypes
+        from ctypes import wintypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = wintypes.DWORD()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except (AttributeError, OSError):
+        return False
 
 
 class CrossPlatformInstaller:
     """Cross-platform installer for CODITECT framework"""
 
-    def __init__(self):
+    def __init__(self, message_queue: Optional[queue.Queue] = None):
+        self.message_queue = message_queue  # GUI log sink for subprocess output
         self.script_dir = Path(__file__).parent.absolute()
         self.project_root = self.script_dir.parent
+        # Run from coditect-install.pyz, the parent is the archive itself;
+        # the project is the directory holding it
+        if self.project_root.is_file():
+            self.project_root = self.project_root.parent
         self.venv_path = self.project_root / "venv"
         self.os_type = platform.system()  # 'Windows', 'Darwin' (macOS), or 'Linux'
 
-        # Disable colors on old Windows terminals
-        if self.os_type == 'Windows':
-            Colors.disable_on_windows()
+        # Shared venvs and their archives (keyed by requirements + interpreter + platform);
+        # self.venv_path is a symlink/junction into this directory
+        self.cache_dir = Path(os.environ.get(
+            "CODITECT_VENV_CACHE",
+            Path.home() / ".cache" / "coditect" / "venvs"
+        ))
+        self.restored_from_cache = False
 
-    def get_python_executable(self) -> str:
-        """Get the correct Python executable name for the platform"""
-        if self.os_type == 'Windows':
-            return 'python'  # Windows typically uses 'python' not 'python3'
-        return 'python3'
+        # Background deletions started by discard_tree()
+        self._discard_threads: List[threading.Thread] = []
 
-    def get_venv_activation_command(self) -> str:
+        # Shared wheel cache so repeated installs skip downloads
+        self.pip_cache_dir = Path.home() / ".cache" / "coditect" / "pip-wheels"
+
+        # Cached pip zipapp used to bootstrap pip into new venvs
+        self.pip_pyz = Path.home() / ".cache" / "coditect" / "pip.pyz"
+
+        # Local wheels (e.g. seeded with 'pip download') for offline installs
+        self.wheelhouse = Path(os.environ.get(
+            "CODITECT_WHEELHOUSE",
+            Path.home() / ".cache" / "coditect" / "wheelhouse"
+        ))
+
+        # Disable colors for pipes, NO_COLOR and old Windows terminals
+        if not supports_color():
+            Colors.disable()
+
+        # Status prefixes, built once instead of on every print
+        self._ok_prefix = f"{Colors.GREEN}✓{Colors.NC} "
+        self._warn_prefix = f"{Colors.YELLOW}⚠{Colors.NC} "
+        self._error_prefix = f"{Colors.RED}✗{Colors.NC} "
+
+    @cached_property
+    def venv_activation_command(self) -> str:
         """Get the correct venv activation command for the platform"""
         if self.os_type == 'Windows':
             return str(self.venv_path / 'Scripts' / 'activate.bat')
         return f'source {self.venv_path / "bin" / "activate"}'
 
-    def get_venv_python(self) -> Path:
+    @cached_property
+    def venv_python(self) -> Path:
         """Get the Python executable inside venv"""
+        # Resolve the link so installed script shebangs name the shared venv
         if self.os_type == 'Windows':
-            return self.venv_path / 'Scripts' / 'python.exe'
-        return self.venv_path / 'bin' / 'python'
+            return self.venv_path.resolve() / 'Scripts' / 'python.exe'
+        return self.venv_path.resolve() / 'bin' / 'python'
 
-    def get_venv_pip(self) -> Path:
-        """Get the pip executable inside venv"""
+    @cached_property
+    def venv_site_packages(self) -> Path:
+        """Get the site-packages directory inside venv"""
         if self.os_type == 'Windows':
-            return self.venv_path / 'Scripts' / 'pip.exe'
-        return self.venv_path / 'bin' / 'pip'
+            return self.venv_path / 'Lib' / 'site-packages'
+        version = f"python{sys.version_info.major}.{sys.version_info.minor}"
+        return self.venv_path / 'lib' / version / 'site-packages'
+
+    def get_venv_package_version(self, name: str) -> Optional[str]:
+        """Read an installed package's version from its dist-info metadata"""
+        wanted = re.sub(r'[-_.]+', '_', name).lower()
+        for dist_info in self.venv_site_packages.glob('*.dist-info'):
+            dist_name = dist_info.name[:-len('.dist-info')].rsplit('-', 1)[0]
+            if re.sub(r'[-_.]+', '_', dist_name).lower() != wanted:
+                continue
+            try:
+                with open(dist_info / 'METADATA', encoding='utf-8', errors='replace') as f:
+                    header = f.read(2048)
+            except OSError:
+                continue
+            match = re.search(r'^Version: (.+)$', header, re.MULTILINE)
+            if match:
+                return match.group(1).strip()
+        return None
+
+    @cached_property
+    def cache_key(self) -> str:
+        """Get the cache key for the current requirements and interpreter"""
+        digest = hashlib.sha256()
+        for name in ('requirements.txt', 'requirements.lock'):
+            requirements_file = self.project_root / name
+            if requirements_file.exists():
+                digest.update(requirements_file.read_bytes())
+        digest.update(sys.version.encode())
+        digest.update(platform.machine().encode())
+        digest.update(self.os_type.encode())
+        return digest.hexdigest()[:16]
+
+    @cached_property
+    def cache_archive(self) -> Path:
+        """Get the path of the cached venv archive"""
+        if zstandard is not None:
+            return self.cache_dir / f"{self.cache_key}.tar.zst"
+        return self.cache_dir / f"{self.cache_key}.tar"
+
+    @cached_property
+    def canonical_venv_path(self) -> Path:
+        """Get the shared venv that the project-local venv links to"""
+        # A --force rebuild lives in its own '<key>.<n>' directory, which this
+        # project keeps using while the requirements stay the same
+        if self.is_venv_link():
+            target = self.venv_path.resolve()
+            if (target.parent == self.cache_dir.resolve()
+                    and target.name.split('.', 1)[0] == self.cache_key):
+                return self.cache_dir / target.name
+        return self.cache_dir / self.cache_key
+
+    def _reset_cached_paths(self, names: Tuple[str, ...] = ('venv_python', 'cache_key',
+                                                         'cache_archive', 'canonical_venv_path')):
+        """Forget memoized paths after the venv link or requirements change"""
+        for name in names:
+            self.__dict__.pop(name, None)
+
+    def is_shared_venv_complete(self) -> bool:
+        """Check whether the shared venv has all dependencies installed"""
+        return (self.canonical_venv_path / VENV_COMPLETE_MARKER).exists()
+
+    def is_venv_link(self) -> bool:
+        """Check whether the project-local venv is a symlink or Windows junction"""
+        if self.venv_path.is_symlink():
+            return True
+        # Junctions are mount-point reparse points, which is_symlink() misses;
+        # only Windows builds define the tag
+        mount_point_tag = getattr(stat, 'IO_REPARSE_TAG_MOUNT_POINT', None)
+        if mount_point_tag is None:
+            return False
+        try:
+            st = os.lstat(self.venv_path)
+        except OSError:
+            return False
+        return getattr(st, 'st_reparse_tag', None) == mount_point_tag
+
+    def link_shared_venv(self):
+        """Point the project-local venv at the shared venv"""
+        canonical = self.canonical_venv_path
+        if self.os_type == 'Windows':
+            # Directory junctions do not need symlink privileges
+            subprocess.run(
+                ['cmd', '/c', 'mklink', '/J', str(self.venv_path), str(canonical)],
+                check=True,
+                capture_output=True
+            )
+        else:
+            os.symlink(canonical, self.venv_path, target_is_directory=True)
+        self._reset_cached_paths(('venv_python',))
+
+    def remove_venv(self):
+        """Remove the project-local venv without touching a shared target"""
+        if self.venv_path.is_symlink():
+            self.venv_path.unlink()
+            return
+        try:
+            os.rmdir(self.venv_path)  # empty dir or Windows junction
+        except OSError:
+            self.discard_tree(self.venv_path)
+
+    def discard_tree(self, path: Path):
+        """Move a directory out of the way and delete it in the background"""
+        if not path.exists():
+            return
+
+        # One rename keeps the per-file unlinks off the critical path
+        doomed = path.with_name(f".old.{os.getpid()}.{time.time_ns()}.{path.name}")
+        try:
+            path.rename(doomed)
+        except OSError:
+            # e.g. files held open on Windows: delete in place
+            shutil.rmtree(path, ignore_errors=True)
+            return
+
+        self._rmtree_in_background(doomed)
+
+    def _rmtree_in_background(self, path: Path):
+        """Delete a directory tree on a daemon thread"""
+        thread = threading.Thread(
+            target=shutil.rmtree,
+            args=(path,),
+            kwargs={'ignore_errors': True},
+            daemon=True
+        )
+        thread.start()
+        self._discard_threads.append(thread)
+
+    def sweep_discarded_trees(self):
+        """Resume deletions that an earlier run's exit cut short"""
+        for parent in (self.venv_path.parent, self.cache_dir):
+            if not parent.is_dir():
+                continue
+            for stale in parent.glob('.old.*'):
+                if DISCARDED_TREE.match(stale.name) and stale.is_dir() and not stale.is_symlink():
+                    self._rmtree_in_background(stale)
+
+    def wait_for_discards(self):
+        """Block until background deletions have finished"""
+        for thread in self._discard_threads:
+            thread.join()
+        self._discard_threads.clear()
+
+    def restore_venv_from_cache(self) -> bool:
+        """Restore the shared venv from a cached archive, if one exists"""
+        archive = self.cache_archive
+        if not archive.exists():
+            # An uncompressed archive written before zstandard was available
+            archive = self.cache_dir / f"{self.cache_key}.tar"
+            if not archive.exists():
+                return False
+
+        canonical = self.canonical_venv_path
+        try:
+            self._extract_archive(archive, self.cache_dir)
+            # Re-point the interpreter links and pyvenv.cfg at this Python
+            self._env_builder(upgrade=True).create(str(canonical))
+        except (OSError, tarfile.TarError, ZstdError) as e:
+            self.print_warning(f"Ignoring unusable venv cache {archive}: {e}")
+            self.discard_tree(canonical)
+            return False
+
+        self.print_status(f"Virtual environment restored from cache ({archive.name})")
+        return True
+
+    def _extract_archive(self, archive: Path, dest: Path):
+        """Unpack a cached venv archive, copying file data in-kernel on Linux"""
+        if archive.suffix == '.zst':
+            with open(archive, 'rb') as f, \
+                    zstandard.ZstdDecompressor().stream_reader(f) as zf, \
+                    tarfile.open(fileobj=zf, mode='r|') as tf:
+                tf.extractall(dest, **TAR_EXTRACT_KWARGS)
+            return
+
+        if self.os_type != 'Linux' or not hasattr(os, 'copy_file_range'):
+            with tarfile.open(archive, 'r') as tf:
+                tf.extractall(dest, **TAR_EXTRACT_KWARGS)
+            return
+
+        # Regular file data sits uncompressed in the archive, so each member
+        # can be copied straight from its offset without passing through Python
+        with tarfile.open(archive, 'r:') as tf:
+            src_fd = tf.fileobj.fileno()
+            for member in tf:
+                if not member.isreg():
+                    tf.extract(member, dest, **TAR_EXTRACT_KWARGS)
+                    continue
+
+                # Same checks extract() applies: no paths outside dest, no
+                # special mode bits, and never write through a symlink
+                if TAR_EXTRACT_KWARGS:
+                    member = tarfile.tar_filter(member, str(dest))
+                target = dest / member.name
+                if not os.path.realpath(target).startswith(os.path.realpath(dest) + os.sep):
+                    raise tarfile.TarError(f"Refusing to extract {member.name!r} outside {dest}")
+                target.parent.mkdir(parents=True, exist_ok=True)
+                dst_fd = os.open(target, os.O_CREAT | os.O_WRONLY | os.O_TRUNC | os.O_NOFOLLOW,
+                                 member.mode)
+                try:
+                    self._copy_range(src_fd, dst_fd, member.offset_data, member.size)
+                finally:
+                    os.close(dst_fd)
+                # Keep mtimes so the cached .pyc files stay valid
+                os.utime(target, (member.mtime, member.mtime))
+
+    def _copy_range(self, src_fd: int, dst_fd: int, offset: int, size: int):
+        """Copy size bytes from offset in src_fd to dst_fd, without userspace buffers"""
+        done = 0
+        try:
+            while done < size:
+                copied = os.copy_file_range(src_fd, dst_fd, size - done, offset + done)
+                if copied == 0:
+                    break
+                done += copied
+        except OSError:
+            # Filesystems or kernels without copy_file_range support
+            while done < size:
+                copied = os.sendfile(dst_fd, src_fd, offset + done, size - done)
+                if copied == 0:
+                    break
+                done += copied
+
+        if done != size:
+            raise OSError(f"Short copy from venv archive ({done} of {size} bytes)")
+
+    def save_venv_to_cache(self) -> bool:
+        """Mark the shared venv complete and pack it for later installs"""
+        canonical = self.canonical_venv_path
+        if not canonical.is_dir() or self.venv_path.resolve() != canonical.resolve():
+            # Legacy project-local venv or stale link: nothing shared to cache
+            return False
+
+        archive = self.cache_archive
+        try:
+            (canonical / VENV_COMPLETE_MARKER).touch()
+            if canonical.name != self.cache_key:
+                # A --force rebuild private to this project: its console
+                # scripts' shebangs name its own directory, so an archive of
+                # it would tie other projects to this one's venv
+                return False
+            if archive.suffix == '.zst':
+                # Low-level multi-threaded zstd: faster than gzip, smaller than tar
+                partial = archive.with_suffix('.part')
+                with open(partial, 'wb') as f, \
+                        zstandard.ZstdCompressor(level=3, threads=-1).stream_writer(f) as zf, \
+                        tarfile.open(fileobj=zf, mode='w|') as tf:
+                    tf.add(str(canonical), arcname=canonical.name)
+                partial.replace(archive)
+            else:
+                shutil.make_archive(
+                    str(archive.with_suffix('')),
+                    'tar',
+                    root_dir=str(self.cache_dir),
+                    base_dir=canonical.name
+                )
+        except (OSError, tarfile.TarError, ZstdError) as e:
+            self.print_warning(f"Could not cache virtual environment: {e}")
+            return False
+
+        self.print_status(f"Virtual environment cached at {archive}")
+        return True
+
+    def _stream(self, cmd: List[str]):
+        """Run a command, forwarding its output line by line as it arrives"""
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=-1,
+            text=True,
+            errors='replace'  # pip output may not match the locale encoding
+        )
+        with proc:
+            for line in iter(proc.stdout.readline, ''):
+                line = line.rstrip()
+                if self.message_queue is not None:
+                    self.message_queue.put(("log", line))
+                else:
+                    print(line)
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
 
     def print_status(self, message: str):
         """Print success message"""
-        print(f"{Colors.GREEN}✓{Colors.NC} {message}")
+        print(self._ok_prefix + message)
 
     def print_warning(self, message: str):
         """Print warning message"""
-        print(f"{Colors.YELLOW}⚠{Colors.NC} {message}")
+        print(self._warn_prefix + message)
 
     def print_error(self, message: str):
         """Print error message"""
-        print(f"{Colors.RED}✗{Colors.NC} {message}")
+        print(self._error_prefix + message)
 
     def print_header(self):
         """Print installation header"""
@@ -113,34 +495,134 @@ class CrossPlatformInstaller:
         self.print_status(f"Python {version} detected")
         return True, version
 
-    def create_venv(self, force_recreate: bool = False) -> bool:
-        """Create virtual environment"""
+    def create_venv(self, force_recreate: bool = False, with_pip: bool = True) -> bool:
+        """Create virtual environment
+
+        With with_pip=False, bootstrapping pip is left to the first
+        install_dependencies() pip run when the pip zipapp is available.
+        """
         print(f"\n{Colors.BLUE}Creating virtual environment...{Colors.NC}\n")
 
+        # The GUI reuses one installer across reinstalls
+        self._reset_cached_paths()
+        self.restored_from_cache = False
+        self.sweep_discarded_trees()
+        canonical = self.canonical_venv_path
+
+        # A link left over from different requirements, or to a shared venv
+        # that has since been deleted, is simply re-pointed
+        if self.is_venv_link() and (not self.venv_path.exists()
+                                    or self.venv_path.resolve() != canonical.resolve()):
+            self.remove_venv()
+            self._reset_cached_paths(('canonical_venv_path',))
+            canonical = self.canonical_venv_path
+
         if self.venv_path.exists():
             if force_recreate:
                 self.print_warning(f"Removing existing venv at {self.venv_path}")
-                shutil.rmtree(self.venv_path)
+                self.remove_venv()
+                # Other projects may link to the shared venv: only a rebuild
+                # private to this project is deleted
+                if canonical.name != self.cache_key:
+                    self.discard_tree(canonical)
             else:
-                self.print_warning(f"Virtual environment already exists at {self.venv_path}")
-                response = input("Do you want to recreate it? (y/N): ").strip().lower()
-                if response == 'y':
-                    print("Removing existing venv...")
-                    shutil.rmtree(self.venv_path)
-                else:
-                    self.print_status("Using existing virtual environment")
-                    return True
+                # Never prompt: scripted runs and the GUI thread have no usable stdin
+                self.print_status(f"Using existing virtual environment at {self.venv_path} "
+                                  "(pass --force to recreate it)")
+                # A link to a finished shared venv needs no further installs
+                self.restored_from_cache = (self.is_venv_link()
+                                            and self.is_shared_venv_complete())
+                return True
 
         try:
-            # Create venv using current Python
-            python_exe = self.get_python_executable()
-            subprocess.run([python_exe, '-m', 'venv', str(self.venv_path)], check=True)
-            self.print_status(f"Virtual environment created at {self.venv_path}")
+            # --force rebuilds from scratch rather than trusting the cache
+            if not force_recreate and (self.is_shared_venv_complete()
+                                       or self.restore_venv_from_cache()):
+                self.link_shared_venv()
+                self.restored_from_cache = True
+                self.print_status(f"Linked {self.venv_path} -> {canonical}")
+                return True
+
+            if force_recreate and canonical.exists():
+                # Rebuild beside the shared venv and re-point only this project
+                canonical = self.cache_dir / f"{self.cache_key}.{time.time_ns()}"
+                self.__dict__['canonical_venv_path'] = canonical
+            else:
+                # Discard a half-built shared venv from an interrupted install
+                self.discard_tree(canonical)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+            # Create venv in-process using current Python while pip.pyz
+            # downloads in the background, then bootstrap pip
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                pip_pyz_fetch = pool.submit(self.fetch_pip_pyz)
+                self._env_builder().create(str(canonical))
+                self.link_shared_venv()
+                pip_pyz_available = pip_pyz_fetch.result()
+                if with_pip or not pip_pyz_available:
+                    self.bootstrap_pip(pip_pyz_available)
+            self.print_status(f"Virtual environment created at {canonical}")
+            self.print_status(f"Linked {self.venv_path} -> {canonical}")
             return True
-        except subprocess.CalledProcessError as e:
+        except (OSError, subprocess.CalledProcessError) as e:
             self.print_error(f"Failed to create virtual environment: {e}")
             return False
 
+    def _env_builder(self, upgrade: bool = False) -> venv.EnvBuilder:
+        """Get a venv builder (symlinked interpreter on POSIX, no ensurepip)"""
+        return venv.EnvBuilder(
+            system_site_packages=False,
+            symlinks=(self.os_type != 'Windows'),
+            upgrade=upgrade,
+            with_pip=False
+        )
+
+    def fetch_pip_pyz(self) -> bool:
+        """Download the pip zipapp into the user cache if it is not there yet"""
+        if self.pip_pyz.exists():
+            return True
+
+        try:
+            self.pip_pyz.parent.mkdir(parents=True, exist_ok=True)
+            partial = self.pip_pyz.with_suffix('.part')
+            # Venv creation waits on this, so a dropped connection must not hang it
+            with urllib.request.urlopen(PIP_PYZ_URL, timeout=PIP_PYZ_TIMEOUT) as response, \
+                    open(partial, 'wb') as f:
+                shutil.copyfileobj(response, f)
+            partial.replace(self.pip_pyz)
+            return True
+        except OSError as e:
+            self.print_warning(f"Could not download pip.pyz ({e}), using ensurepip")
+            return False
+
+    def bootstrap_pip(self, pip_pyz_available: bool):
+        """Install pip into the venv from the cached pip zipapp"""
+        venv_python = str(self.venv_python)
+
+        if not pip_pyz_available:
+            # Offline or blocked: fall back to the bundled ensurepip wheels
+            subprocess.run([venv_python, '-m', 'ensurepip', '--default-pip'], check=True)
+            return
+
+        self._stream([venv_python, str(self.pip_pyz), 'install', '--quiet', '--ignore-installed',
+                      '--cache-dir', str(self.pip_cache_dir), 'pip'])
+
+    def ensure_pip(self):
+        """Bootstrap pip into the venv if create_venv() deferred it"""
+        if self.get_venv_package_version('pip') is None:
+            self.bootstrap_pip(self.pip_pyz.exists())
+
+    def _pip_install_command(self) -> List[str]:
+        """Get the 'pip install' command for the venv"""
+        venv_python = str(self.venv_python)
+        if self.get_venv_package_version('pip') is None and self.pip_pyz.exists():
+            # pip.pyz installs into the interpreter running it, so a run that
+            # also installs 'pip' bootstraps it along with everything else.
+            # The zipapp's own pip must not count as already installed.
+            return [venv_python, str(self.pip_pyz), 'install', '--ignore-installed']
+        self.ensure_pip()
+        return [venv_python, '-m', 'pip', 'install']
+
     def install_dependencies(self) -> bool:
         """Install dependencies from requirements.txt"""
         print(f"\n{Colors.BLUE}Installing dependencies...{Colors.NC}\n")
@@ -150,43 +632,33 @@ class CrossPlatformInstaller:
             self.print_error("Virtual environment not found. Run without --deps-only first.")
             return False
 
-        try:
-            venv_pip = str(self.get_venv_pip())
-            venv_python = str(self.get_venv_python())
-
-            # Upgrade pip first
-            print("Upgrading pip...")
-            subprocess.run(
-                [venv_python, '-m', 'pip', 'install', '--upgrade', 'pip'],
-                check=True,
-                capture_output=True
-            )
-            self.print_status("pip upgraded")
+        if self.restored_from_cache:
+            self.print_status("Dependencies restored from venv cache")
+            return True
 
-            # Install requirements
+        try:
+            # Install requirements (lockfile skips dependency resolution)
+            lock_file = self.project_root / 'requirements.lock'
             requirements_file = self.project_root / 'requirements.txt'
-            if requirements_file.exists():
+            if lock_file.exists():
+                print("Installing from requirements.lock...")
+                self.install_from_lockfile(lock_file)
+                self.print_status("Dependencies installed from requirements.lock")
+            elif requirements_file.exists():
                 print("Installing from requirements.txt...")
-                subprocess.run(
-                    [venv_pip, 'install', '-r', str(requirements_file)],
-                    check=True
-                )
-                self.print_status("Dependencies installed from requirements.txt")
+                self.install_from_requirements(requirements_file)
             else:
                 self.print_warning("requirements.txt not found, skipping dependency installation")
+                self.ensure_pip()
                 return True
 
+            self.compile_site_packages()
+
             # Verify GitPython installation
-            try:
-                result = subprocess.run(
-                    [venv_python, '-c', 'import git; print(git.__version__)'],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                version = result.stdout.strip()
+            version = self.get_venv_package_version('GitPython')
+            if version:
                 self.print_status(f"GitPython {version} installed (80x faster git operations)")
-            except subprocess.CalledProcessError:
+            else:
                 self.print_warning("GitPython not installed - git operations will use subprocess fallback")
 
             return True
@@ -195,6 +667,85 @@ class CrossPlatformInstaller:
             self.print_error(f"Dependency installation failed: {e}")
             return False
 
+    def compile_site_packages(self):
+        """Byte-compile installed packages on all cores (pip runs use --no-compile)"""
+        print("Compiling Python bytecode...")
+        try:
+            self._stream([str(self.venv_python), '-m', 'compileall', '-j', '0', '-q',
+                          str(self.venv_site_packages)])
+        except subprocess.CalledProcessError:
+            # Some packages ship files that do not compile (e.g. test fixtures)
+            self.print_warning("Some files could not be byte-compiled")
+
+    def install_from_requirements(self, requirements_file: Path):
+        """Install dependencies from requirements.txt, offline when possible"""
+        if self._all_wheels_cached(requirements_file):
+            try:
+                if self.get_venv_package_version('pip') is None:
+                    # pip.pyz would fetch pip from the index; ensurepip's wheel is local
+                    self.bootstrap_pip(pip_pyz_available=False)
+                self._stream([str(self.venv_python), '-m', 'pip', 'install', '--no-index',
+                              '--find-links', str(self.wheelhouse), '--no-compile',
+                              '-r', str(requirements_file)])
+                self.print_status(f"Dependencies installed offline from {self.wheelhouse}")
+                return
+            except subprocess.CalledProcessError:
+                # Usually a transitive dependency missing from the wheelhouse
+                self.print_warning("Offline install incomplete, retrying from the package index")
+
+        # Upgrade pip alongside the requirements in a single pip run
+        self._stream(self._pip_install_command() + [
+            '--upgrade', '--prefer-binary', '--no-compile',
+            '--cache-dir', str(self.pip_cache_dir),
+            'pip', 'wheel', 'setuptools', '-r', str(requirements_file)
+        ])
+        self.print_status("pip upgraded and dependencies installed from requirements.txt")
+
+    def _all_wheels_cached(self, requirements_file: Path) -> bool:
+        """Check whether every requirement is an exact pin with a wheel in the wheelhouse"""
+        if not self.wheelhouse.is_dir():
+            return False
+
+        available = set()
+        for wheel in self.wheelhouse.glob('*.whl'):
+            parts = wheel.name.split('-')
+            if len(parts) >= 5:
+                available.add((re.sub(r'[-_.]+', '_', parts[0]).lower(), parts[1].lower()))
+
+        pins = []
+        for line in requirements_file.read_text(encoding='utf-8').splitlines():
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            match = PINNED_REQUIREMENT.match(line)
+            if not match:
+                # Options, includes, ranges or markers: let pip resolve online
+                return False
+            pins.append((re.sub(r'[-_.]+', '_', match.group(1)).lower(), match.group(2).lower()))
+
+        return bool(pins) and all(pin in available for pin in pins)
+
+    def install_from_lockfile(self, lock_file: Path):
+        """Install pinned dependencies from a lockfile without resolving"""
+        venv_python = str(self.venv_python)
+
+        uv = shutil.which('uv')
+        if uv:
+            try:
+                self._stream([uv, 'pip', 'sync', '--python', venv_python,
+                              '--cache-dir', str(self.pip_cache_dir), str(lock_file)])
+                # create_venv() may have deferred pip, and sync removes
+                # anything the lockfile does not list
+                self.ensure_pip()
+                return
+            except subprocess.CalledProcessError:
+                self.print_warning("uv pip sync failed, falling back to pip")
+
+        # pip switches to hash-checking mode on its own when the lockfile has hashes
+        self.ensure_pip()
+        self._stream([venv_python, '-m', 'pip', 'install', '--no-deps', '--no-compile',
+                      '--cache-dir', str(self.pip_cache_dir), '-r', str(lock_file)])
+
     def print_next_steps(self):
         """Print next steps for the user"""
         print(f"\n{Colors.BLUE}{'='*68}{Colors.NC}")
@@ -204,13 +755,14 @@ class CrossPlatformInstaller:
         print(f"{Colors.YELLOW}Next steps:{Colors.NC}\n")
 
         print("1. Activate the virtual environment:")
-        activation_cmd = self.get_venv_activation_command()
+        activation_cmd = self.venv_activation_command
         if self.os_type == 'Windows':
             print(f"   {Colors.CYAN}{activation_cmd}{Colors.NC}")
         else:
             print(f"   {Colors.CYAN}{activation_cmd}{Colors.NC}")
 
         print("\n2. Run tests to verify installation:")
+        # Display name only; the installer itself always runs sys.executable
         venv_python = "python" if self.os_type == 'Windows' else "python3"
         print(f"   {Colors.CYAN}{venv_python} tests/core/test_memory_context_integration.py{Colors.NC}")
         print(f"   {Colors.CYAN}{venv_python} tests/core/test_performance_benchmarks.py{Colors.NC}")
@@ -222,8 +774,17 @@ class CrossPlatformInstaller:
         print("  GitPython provides 80x faster git operations compared to subprocess.")
         print("  All git operations in MEMORY-CONTEXT system will automatically use GitPython.\n")
 
-    def run(self, venv_only: bool = False, deps_only: bool = False) -> int:
+    def run(self, venv_only: bool = False, deps_only: bool = False,
+            force_recreate: bool = False) -> int:
         """Main installation flow"""
+        try:
+            return self._install(venv_only, deps_only, force_recreate)
+        finally:
+            # Deletions run on daemon threads, which die with the interpreter
+            self.wait_for_discards()
+
+    def _install(self, venv_only: bool, deps_only: bool, force_recreate: bool) -> int:
+        """Run the installation steps"""
         self.print_header()
 
         # Check Python version
@@ -232,15 +793,17 @@ class CrossPlatformInstaller:
             self.print_error(message)
             return 1
 
-        # Create virtual environment
+        # Create virtual environment (pip comes with the dependencies unless venv-only)
         if not deps_only:
-            if not self.create_venv():
+            if not self.create_venv(force_recreate=force_recreate, with_pip=venv_only):
                 return 1
 
         # Install dependencies
         if not venv_only:
             if not self.install_dependencies():
                 return 1
+            if not self.restored_from_cache:
+                self.save_venv_to_cache()
 
         # Print next steps
         self.print_next_steps()
@@ -259,6 +822,7 @@ Examples:
   python3 scripts/install.py              # Full installation
   python3 scripts/install.py --venv-only  # Only create venv
   python3 scripts/install.py --deps-only  # Only install dependencies
+  python3 scripts/install.py --force      # Recreate an existing venv
 
 Supported Platforms:
   - Windows 10/11
@@ -281,6 +845,11 @@ Requirements:
         action='store_true',
         help='Only install dependencies (assumes venv exists)'
     )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Recreate the virtual environment if it already exists'
+    )
 
     args = parser.parse_args()
 
@@ -289,9 +858,14 @@ Requirements:
         print("Error: Cannot use --venv-only and --deps-only together")
         return 1
 
+    if args.force and args.deps_only:
+        print("Error: Cannot use --force and --deps-only together")
+        return 1
+
     # Run installer
     installer = CrossPlatformInstaller()
-    return installer.run(venv_only=args.venv_only, deps_only=args.deps_only)
+    return installer.run(venv_only=args.venv_only, deps_only=args.deps_only,
+                         force_recreate=args.force)
 
 
 if __name__ == '__main__':
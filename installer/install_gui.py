@@ -13,7 +13,7 @@ Features:
 - Success notifications
 
 Usage:
-    python3 scripts/install_gui.py
+    python3 -m installer.install_gui
 
 Requirements:
     - Python 3.8+
@@ -30,7 +30,6 @@ import subprocess
 import platform
 import threading
 import queue
-from pathlib import Path
 from typing import Optional
 
 # Import tkinter with error handling
@@ -38,6 +37,8 @@ try:
     import tkinter as tk
     from tkinter import ttk, scrolledtext, messagebox
 except ImportError:
+    if __name__ != '__main__':
+        raise  # let importers (the launcher) fall back to the CLI installer
     print("Error: tkinter not found. Please install tkinter:")
     print("  Ubuntu/Debian: sudo apt-get install python3-tk")
     print("  Fedora: sudo dnf install python3-tkinter")
@@ -46,8 +47,15 @@ except ImportError:
     sys.exit(1)
 
 # Import the CLI installer
-sys.path.insert(0, str(Path(__file__).parent))
-from install import CrossPlatformInstaller
+from .install import CrossPlatformInstaller
+
+# Message queue poll intervals (ms)
+POLL_INTERVAL_ACTIVE_MS = 50
+POLL_INTERVAL_IDLE_MS = 250
+
+# Log lines kept at the start and end of the log once it grows too long
+LOG_HEAD_LINES = 200
+LOG_TAIL_LINES = 500
 
 
 class InstallerGUI:
@@ -67,14 +75,21 @@ class InstallerGUI:
         self.installing = False
         self.installation_complete = False
 
+        # Log state (the log keeps its first and last lines only)
+        self._log_line_count = 0
+        self._log_lines_truncated = 0
+
         # Thread communication
         self.message_queue = queue.Queue()
 
+        # Shared installer instance (reused across install and summary)
+        self.installer = CrossPlatformInstaller(message_queue=self.message_queue)
+
         # Build UI
         self._create_ui()
 
         # Start message processor
-        self.root.after(100, self._process_messages)
+        self.root.after(POLL_INTERVAL_IDLE_MS, self._process_messages)
 
     def _create_ui(self):
         """Create the user interface"""
@@ -168,6 +183,11 @@ class InstallerGUI:
         )
         self.log_text.pack(fill=tk.BOTH, expand=True)
 
+        # The log is written from the message pump; call the Tcl text command
+        # directly instead of going through the Python widget wrappers
+        self._log_widget = str(self.log_text)
+        self._tk_call = self.log_text.tk.call
+
         # Buttons Section
         button_frame = tk.Frame(self.root)
         button_frame.pack(fill=tk.X, padx=20, pady=(10, 20))
@@ -213,10 +233,34 @@ class InstallerGUI:
 
     def _log_message(self, message: str):
         """Add message to log display"""
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
+        self._log_lines([message])
+
+    def _log_lines(self, lines):
+        """Add several messages to log display with a single insert"""
+        text = "\n".join(lines) + "\n"
+        self._log_line_count += text.count("\n")
+
+        call, widget = self._tk_call, self._log_widget
+        call(widget, "configure", "-state", "normal")
+        call(widget, "insert", "end", text)
+        self._truncate_log()
+        call(widget, "see", "end")
+        call(widget, "configure", "-state", "disabled")
+
+    def _truncate_log(self):
+        """Keep only the first and last log lines, eliding the middle"""
+        marker_lines = 1 if self._log_lines_truncated else 0
+        excess = self._log_line_count - LOG_HEAD_LINES - marker_lines - LOG_TAIL_LINES
+        if excess <= 0:
+            return
+
+        # Drop the old marker together with the excess lines, then re-insert it
+        first = LOG_HEAD_LINES + 1
+        self._tk_call(self._log_widget, "delete", f"{first}.0", f"{first + marker_lines + excess}.0")
+        self._log_lines_truncated += excess
+        self._tk_call(self._log_widget, "insert", f"{first}.0",
+                      f"… (truncated {self._log_lines_truncated} lines) …\n")
+        self._log_line_count = LOG_HEAD_LINES + 1 + LOG_TAIL_LINES
 
     def _update_progress(self, message: str):
         """Update progress label"""
@@ -227,26 +271,33 @@ class InstallerGUI:
         if self.installing:
             return
 
-        # Disable install button
-        self.install_button.config(state=tk.DISABLED, bg="#9ca3af")
+        # "Reinstall" (after a successful install) recreates the venv
+        force_recreate = self.installation_complete
 
         # Reset state
         self.installing = True
         self.installation_complete = False
+        self._log_line_count = 0
+        self._log_lines_truncated = 0
 
-        # Clear log
+        # Widget updates back to back, then a single redraw
+        self.install_button.config(state=tk.DISABLED, bg="#9ca3af")
         self.log_text.config(state=tk.NORMAL)
         self.log_text.delete(1.0, tk.END)
         self.log_text.config(state=tk.DISABLED)
-
-        # Start progress animation
+        self.progress_bar.config(mode='indeterminate', value=0)
         self.progress_bar.start(10)
+        self.root.update_idletasks()
 
         # Run installation in separate thread
-        install_thread = threading.Thread(target=self._run_installation, daemon=True)
+        install_thread = threading.Thread(
+            target=self._run_installation,
+            args=(force_recreate,),
+            daemon=True
+        )
         install_thread.start()
 
-    def _run_installation(self):
+    def _run_installation(self, force_recreate: bool = False):
         """Run installation in background thread"""
         try:
             self.message_queue.put(("log", "Starting installation..."))
@@ -268,8 +319,8 @@ class InstallerGUI:
             self.message_queue.put(("progress", "Creating virtual environment..."))
             self.message_queue.put(("log", "Creating virtual environment..."))
 
-            installer = CrossPlatformInstaller()
-            if not installer.create_venv():
+            installer = self.installer
+            if not installer.create_venv(force_recreate=force_recreate, with_pip=False):
                 self.message_queue.put(("error", "Failed to create virtual environment"))
                 return
 
@@ -284,6 +335,9 @@ class InstallerGUI:
                 self.message_queue.put(("error", "Failed to install dependencies"))
                 return
 
+            if not installer.restored_from_cache:
+                installer.save_venv_to_cache()
+
             self.message_queue.put(("log", "✓ Dependencies installed"))
             self.message_queue.put(("log", ""))
 
@@ -295,24 +349,35 @@ class InstallerGUI:
 
     def _process_messages(self):
         """Process messages from installation thread"""
-        try:
-            while True:
+        # Drain the whole queue, batching consecutive log lines into one insert
+        pending_logs = []
+        while True:
+            try:
                 message_type, message = self.message_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if message_type == "log":
+                pending_logs.append(message)
+                continue
+
+            if pending_logs:
+                self._log_lines(pending_logs)
+                pending_logs = []
 
-                if message_type == "log":
-                    self._log_message(message)
-                elif message_type == "progress":
-                    self._update_progress(message)
-                elif message_type == "success":
-                    self._installation_success(message)
-                elif message_type == "error":
-                    self._installation_error(message)
+            if message_type == "progress":
+                self._update_progress(message)
+            elif message_type == "success":
+                self._installation_success(message)
+            elif message_type == "error":
+                self._installation_error(message)
 
-        except queue.Empty:
-            pass
+        if pending_logs:
+            self._log_lines(pending_logs)
 
-        # Schedule next check
-        self.root.after(100, self._process_messages)
+        # Schedule next check (poll faster while the worker is producing output)
+        interval = POLL_INTERVAL_ACTIVE_MS if self.installing else POLL_INTERVAL_IDLE_MS
+        self.root.after(interval, self._process_messages)
 
     def _installation_success(self, message: str):
         """Handle successful installation"""
@@ -331,8 +396,7 @@ class InstallerGUI:
         self._log_message("=" * 68)
         self._log_message("")
 
-        installer = CrossPlatformInstaller()
-        activation_cmd = installer.get_venv_activation_command()
+        activation_cmd = self.installer.venv_activation_command
 
         self._log_message("Next steps:")
         self._log_message("")
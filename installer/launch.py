@@ -24,71 +24,256 @@ Usage:
     # CLI options (when in CLI mode)
     python3 scripts/installer/launch.py --cli --venv-only
     python3 scripts/installer/launch.py --cli --deps-only
+    python3 scripts/installer/launch.py --cli --force
+
+    # Single-file build (see build_pyz.py)
+    ./coditect-install.pyz --gui
 
 Author: AZ1.AI CODITECT Team
 Sprint: Sprint +1 Week 2
 Date: 2025-11-16
 """
 
+import os
 import sys
-import argparse
-from pathlib import Path
+from functools import lru_cache
+from importlib import import_module
+from types import SimpleNamespace
 
-# Add installer package to path
-INSTALLER_DIR = Path(__file__).parent
-sys.path.insert(0, str(INSTALLER_DIR))
+# os.path only: pathlib would add imports to every launch.
+# Installer modules are loaded from here by path, not via sys.path.
+INSTALLER_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# In the zipapp build (coditect-install.pyz) INSTALLER_DIR lies inside the
+# archive: the package is already imported through zipimport and there is
+# no install.py on disk to exec
+FROM_ARCHIVE = not os.path.isdir(INSTALLER_DIR)
 
-def check_gui_available() -> bool:
-    """Check if GUI (tkinter) is available"""
+# Decorative output (banner, auto-detect notes) is only for people at a
+# terminal; errors always go to stderr. Under pythonw stdout is None.
+_TTY = sys.stdout is not None and sys.stdout.isatty()
+
+# Console messages, each emitted with a single write
+BANNER = "\n" + "=" * 70 + "\nCODITECT Framework Installer\n" + "=" * 70 + "\n\n"
+
+TKINTER_MISSING_HELP = """Error: GUI mode requested but tkinter not available
+
+Install tkinter:
+  Ubuntu/Debian: sudo apt-get install python3-tk
+  Fedora: sudo dnf install python3-tkinter
+  macOS: tkinter should be included with Python
+  Windows: tkinter should be included with Python
+"""
+
+AUTO_GUI_MESSAGE = """✓ GUI available - launching graphical installer
+  (Use --cli flag to force command-line mode)
+
+"""
+
+AUTO_CLI_MESSAGE = """ℹ GUI not available - launching command-line installer
+  (Install tkinter for graphical installer)
+
+"""
+
+# CLI installs run in-process inside the archive and in launch daemon
+# children (to reuse the preloaded modules) instead of exec'ing install.py
+RUN_CLI_IN_PROCESS = FROM_ARCHIVE
+
+
+# Load the installer package straight from INSTALLER_DIR, leaving sys.path alone
+def load_installer_package():
+    package = sys.modules.get("installer")
+    if package is not None and INSTALLER_DIR in getattr(package, "__path__", ()):
+        return package
+
+    from importlib.util import module_from_spec, spec_from_file_location
+
+    # Registering the package lets install_gui's relative import resolve
+    # against INSTALLER_DIR without a sys.path entry
+    spec = spec_from_file_location(
+        "installer",
+        os.path.join(INSTALLER_DIR, "__init__.py"),
+        submodule_search_locations=[INSTALLER_DIR]
+    )
+    package = module_from_spec(spec)
+    sys.modules["installer"] = package
     try:
-        import tkinter
-        return True
-    except ImportError:
-        return False
+        spec.loader.exec_module(package)
+    except BaseException:
+        del sys.modules["installer"]
+        raise
+    return package
 
 
-def launch_gui():
-    """Launch GUI installer"""
+# Check if GUI (tkinter) is available
+@lru_cache(maxsize=None)
+def check_gui_available() -> bool:
+    from importlib.util import find_spec
+
+    # Locate, but do not load, tkinter and its C extension (often packaged separately)
+    return find_spec("tkinter") is not None and find_spec("_tkinter") is not None
+
+
+# Launch GUI installer
+def launch_gui(preload=None):
     print("Launching GUI installer...")
+
+    # Bail out before paying for any imports if tkinter cannot load
+    if not check_gui_available():
+        print("GUI installer unavailable: tkinter not found", file=sys.stderr)
+        print("\nFalling back to CLI installer...", file=sys.stderr)
+        launch_cli()
+        return
+
+    # A started preload has done (or failed) the imports below already
+    if preload is not None:
+        preload.join()
+    try:
+        load_installer_package()
+        install_gui = import_module("installer.install_gui")
+    except ImportError as e:
+        print(f"GUI installer unavailable: {e}", file=sys.stderr)
+        print("\nFalling back to CLI installer...", file=sys.stderr)
+        launch_cli()
+        return
+
+    # Only Tk start-up failures (no display, broken Tcl) fall back to the CLI;
+    # anything else reaches main's top-level handler
     try:
-        import install_gui
         install_gui.main()
-    except Exception as e:
-        print(f"Failed to launch GUI installer: {e}")
-        print("\nFalling back to CLI installer...")
+    except install_gui.tk.TclError as e:
+        print(f"Failed to launch GUI installer: {e}", file=sys.stderr)
+        print("\nFalling back to CLI installer...", file=sys.stderr)
         launch_cli()
 
 
-def launch_cli(venv_only=False, deps_only=False):
-    """Launch CLI installer"""
+# Hand off to the CLI installer, replacing the launcher process
+def launch_cli(venv_only=False, deps_only=False, force=False):
     print("Launching CLI installer...")
-    try:
-        from install import CrossPlatformInstaller
+    if RUN_CLI_IN_PROCESS:
+        from installer.install import CrossPlatformInstaller
 
         installer = CrossPlatformInstaller()
-        exit_code = installer.run(venv_only=venv_only, deps_only=deps_only)
-        sys.exit(exit_code)
-    except Exception as e:
-        print(f"Failed to launch CLI installer: {e}")
+        sys.exit(installer.run(venv_only=venv_only, deps_only=deps_only,
+                               force_recreate=force))
+
+    argv = [sys.executable, os.path.join(INSTALLER_DIR, "install.py")]
+    if venv_only:
+        argv.append("--venv-only")
+    if deps_only:
+        argv.append("--deps-only")
+    if force:
+        argv.append("--force")
+
+    # Anything still buffered would be lost when the process image is replaced
+    flush_output()
+    try:
+        if os.name == 'nt':
+            # execv on Windows spawns a new process and returns control to the
+            # console early, so wait on a child instead
+            import subprocess
+            sys.exit(subprocess.run(argv, check=False).returncode)
+        os.execv(argv[0], argv)
+    except OSError as e:
+        print(f"Failed to launch CLI installer: {e}", file=sys.stderr)
         sys.exit(1)
 
 
+# Load launch_daemon.py on its own, so --client does not import the installer
+def load_launch_daemon():
+    if FROM_ARCHIVE:
+        return import_module("installer.launch_daemon")
+
+    from importlib.util import module_from_spec, spec_from_file_location
+
+    spec = spec_from_file_location(
+        "coditect_launch_daemon", os.path.join(INSTALLER_DIR, "launch_daemon.py")
+    )
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Warm the daemon with everything a forked launch would otherwise import
+def preload_installers():
+    load_installer_package()
+    import_module("installer.install")
+    if check_gui_available():
+        try:
+            import_module("installer.install_gui")
+        except ImportError:
+            pass
+
+
+# Import the GUI installer on a worker thread while the banner is written.
+# CLI launches exec a fresh interpreter, so they have nothing to warm.
+def start_gui_preload():
+    import threading
+
+    def preload():
+        try:
+            preload_installers()
+        except ImportError:
+            pass  # launch_gui retries the import and reports the failure
+
+    thread = threading.Thread(target=preload, name="gui-preload", daemon=True)
+    thread.start()
+    return thread
+
+
+# Run one forwarded launch inside a forked daemon child
+def run_forwarded(argv):
+    global RUN_CLI_IN_PROCESS, _TTY
+    RUN_CLI_IN_PROCESS = True
+    _TTY = sys.stdout is not None and sys.stdout.isatty()  # now the client's
+    sys.argv = [sys.argv[0]] + list(argv)
+    return main()
+
+
+# Handle --serve / --client: the opt-in warm launch daemon
+def run_daemon_mode(mode, argv):
+    launch_daemon = load_launch_daemon()
+    if not launch_daemon.daemon_enabled():
+        print(f"Error: {mode} requires {launch_daemon.DAEMON_ENV_VAR}=1", file=sys.stderr)
+        return 1
+    if not launch_daemon.daemon_supported():
+        print(f"Error: {mode} is not supported on this platform", file=sys.stderr)
+        return 1
+
+    if mode == '--serve':
+        if argv:
+            print("Error: --serve takes no other options", file=sys.stderr)
+            return 1
+        return launch_daemon.serve(run_forwarded, preload_installers)
+
+    exit_code = launch_daemon.forward(argv)
+    if exit_code is None:
+        # No daemon listening: launch here instead
+        print("Launch daemon not running - launching directly", file=sys.stderr)
+        sys.argv = [sys.argv[0]] + list(argv)
+        return main()
+    return exit_code
+
+
+# Flush console output before a handoff; either stream is None under pythonw
+def flush_output():
+    for stream in (sys.stdout, sys.stderr):
+        if stream is not None:
+            stream.flush()
+
+
+# Print welcome banner
 def print_banner():
-    """Print welcome banner"""
-    print()
-    print("=" * 70)
-    print("CODITECT Framework Installer")
-    print("=" * 70)
-    print()
+    if _TTY:
+        sys.stdout.write(BANNER)
 
 
-def main():
-    """Main entry point"""
-    parser = argparse.ArgumentParser(
-        description='CODITECT Framework Universal Installer Launcher',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Flags the fast path understands without argparse
+FAST_PATH_FLAGS = frozenset({'--gui', '--cli', '--venv-only', '--deps-only', '--force'})
+
+
+# Only rendered by --help, which always takes the argparse path
+_EPILOG = """
 Examples:
   python3 scripts/installer/launch.py           # Auto-detect GUI/CLI
   python3 scripts/installer/launch.py --gui     # Force GUI mode
@@ -96,6 +281,7 @@ Examples:
 
   python3 scripts/installer/launch.py --cli --venv-only  # CLI: venv only
   python3 scripts/installer/launch.py --cli --deps-only  # CLI: deps only
+  python3 scripts/installer/launch.py --cli --force      # CLI: recreate venv
 
 GUI Mode:
   Launches modern graphical installer with progress tracking and logs.
@@ -105,7 +291,38 @@ CLI Mode:
 
 Auto Mode (default):
   Attempts GUI first, falls back to CLI if tkinter unavailable.
-        """
+
+Launch Daemon (opt-in, POSIX, CODITECT_LAUNCH_DAEMON=1):
+  launch.py --serve            # Preload the installer and wait for launches
+  launch.py --client [args]    # Run a launch in the warm daemon
+"""
+
+
+# Parse launcher arguments, only importing argparse when needed
+def parse_args(argv):
+    tokens = set(argv)
+    if tokens <= FAST_PATH_FLAGS and not {'--gui', '--cli'} <= tokens:
+        return SimpleNamespace(
+            gui='--gui' in tokens,
+            cli='--cli' in tokens,
+            venv_only='--venv-only' in tokens,
+            deps_only='--deps-only' in tokens,
+            force='--force' in tokens,
+        )
+    # --help, unknown flags and conflicts get argparse's messages
+    return _slow_parse(argv)
+
+
+# Parse arguments with argparse
+def _slow_parse(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='CODITECT Framework Universal Installer Launcher',
+        # Needed for --help: the default formatter re-wraps the epilog and
+        # would run its example lines together
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
 
     # Mode selection
@@ -132,60 +349,87 @@ Auto Mode (default):
         action='store_true',
         help='CLI: Only install dependencies (assumes venv exists)'
     )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='CLI: Recreate the virtual environment if it already exists'
+    )
+
+    return parser.parse_args(argv)
 
-    args = parser.parse_args()
+
+# Main entry point
+def main():
+    argv = sys.argv[1:]
+    if argv[:1] in (['--serve'], ['--client']):
+        return run_daemon_mode(argv[0], argv[1:])
+
+    args = parse_args(argv)
+    gui, cli = args.gui, args.cli
+    venv_only, deps_only, force = args.venv_only, args.deps_only, args.force
 
     # Validate CLI options
-    if (args.venv_only or args.deps_only) and not args.cli:
-        print("Error: --venv-only and --deps-only require --cli mode")
+    if (venv_only or deps_only or force) and not cli:
+        print("Error: --venv-only, --deps-only and --force require --cli mode", file=sys.stderr)
+        return 1
+
+    if venv_only and deps_only:
+        print("Error: Cannot use --venv-only and --deps-only together", file=sys.stderr)
         return 1
 
-    if args.venv_only and args.deps_only:
-        print("Error: Cannot use --venv-only and --deps-only together")
+    if force and deps_only:
+        print("Error: Cannot use --force and --deps-only together", file=sys.stderr)
         return 1
 
+    # Overlap the GUI imports with console output when the GUI will run
+    preload = None
+    if not cli and check_gui_available():
+        preload = start_gui_preload()
+
     # Print banner
     print_banner()
 
     # Launch appropriate installer
-    if args.gui:
+    if gui:
         # Force GUI mode
         if not check_gui_available():
-            print("Error: GUI mode requested but tkinter not available")
-            print("\nInstall tkinter:")
-            print("  Ubuntu/Debian: sudo apt-get install python3-tk")
-            print("  Fedora: sudo dnf install python3-tkinter")
-            print("  macOS: tkinter should be included with Python")
-            print("  Windows: tkinter should be included with Python")
+            print(TKINTER_MISSING_HELP, end="", file=sys.stderr)
             return 1
-        launch_gui()
+        flush_output()
+        launch_gui(preload)
 
-    elif args.cli:
+    elif cli:
         # Force CLI mode
-        launch_cli(venv_only=args.venv_only, deps_only=args.deps_only)
+        flush_output()
+        launch_cli(venv_only=venv_only, deps_only=deps_only, force=force)
 
     else:
         # Auto-detect mode
         if check_gui_available():
-            print("✓ GUI available - launching graphical installer")
-            print("  (Use --cli flag to force command-line mode)")
-            print()
-            launch_gui()
+            if _TTY:
+                sys.stdout.write(AUTO_GUI_MESSAGE)
+            flush_output()
+            launch_gui(preload)
         else:
-            print("ℹ GUI not available - launching command-line installer")
-            print("  (Install tkinter for graphical installer)")
-            print()
+            if _TTY:
+                sys.stdout.write(AUTO_CLI_MESSAGE)
+            flush_output()
             launch_cli()
 
     return 0
 
 
-if __name__ == '__main__':
+# Script entry point, shared with the zipapp's __main__
+def run_launcher():
     try:
-        sys.exit(main())
+        return main()
     except KeyboardInterrupt:
         print("\n\nInstallation cancelled by user")
-        sys.exit(1)
+        return 1
     except Exception as e:
-        print(f"\n\nUnexpected error: {e}")
-        sys.exit(1)
+        print(f"\n\nUnexpected error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_launcher())
@@ -0,0 +1,251 @@
+"""
+CODITECT Installer Launch Daemon
+
+Optional warm launcher for developers re-running the installer. The server
+preloads the installer modules once and forks a child per launch, so repeat
+runs skip interpreter startup and module imports.
+
+Features:
+- Per-user Unix domain socket, reachable only by its owner
+- Client forwards its arguments, working directory, environment and
+  standard streams; the forked child runs the launch against them
+- Exit status and Ctrl-C are relayed between client and child
+- Opt-in only: requires CODITECT_LAUNCH_DAEMON=1 (POSIX only)
+
+Usage:
+    # Start the daemon (keeps running until interrupted)
+    CODITECT_LAUNCH_DAEMON=1 python3 scripts/installer/launch.py --serve
+
+    # Forward a launch to it
+    CODITECT_LAUNCH_DAEMON=1 python3 scripts/installer/launch.py --client --cli --venv-only
+
+Author: AZ1.AI CODITECT Team
+Date: 2026-10-15
+"""
+
+import array
+import json
+import os
+import signal
+import socket
+import struct
+import sys
+import tempfile
+from typing import Optional
+
+DAEMON_ENV_VAR = "CODITECT_LAUNCH_DAEMON"
+
+# The client passes stdin, stdout and stderr, in that order
+STDIO_FD_COUNT = 3
+
+# Child pid, then exit status, each as a network-order int
+REPLY_FIELD = struct.Struct("!i")
+
+RECV_CHUNK = 65536
+
+
+def daemon_enabled() -> bool:
+    """Check whether the launch daemon has been opted into"""
+    return os.environ.get(DAEMON_ENV_VAR) == "1"
+
+
+def daemon_supported() -> bool:
+    """Check whether this platform can fork and pass descriptors"""
+    return hasattr(os, "fork") and hasattr(socket, "AF_UNIX") and hasattr(socket, "SCM_RIGHTS")
+
+
+def socket_path() -> str:
+    """Per-user socket location, preferring the private runtime directory"""
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(base, f"coditect-launch-{os.getuid()}.sock")
+
+
+def _exit_status(code) -> int:
+    """Translate a SystemExit code into a process exit status"""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _recv_exact(conn, size: int) -> bytes:
+    """Read exactly size bytes, or fewer if the peer hangs up"""
+    data = b""
+    while len(data) < size:
+        chunk = conn.recv(size - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+def _receive_request(conn):
+    """Read a forwarded launch: JSON payload plus the client's stdio descriptors"""
+    fds = array.array("i")
+    data, ancdata, _flags, _addr = conn.recvmsg(
+        RECV_CHUNK, socket.CMSG_SPACE(STDIO_FD_COUNT * fds.itemsize)
+    )
+    for level, kind, cdata in ancdata:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            fds.frombytes(cdata[:len(cdata) - len(cdata) % fds.itemsize])
+
+    chunks = [data]
+    while True:
+        chunk = conn.recv(RECV_CHUNK)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return json.loads(b"".join(chunks)), list(fds)
+
+
+def _handle_launch(conn, run) -> None:
+    """Forked child: adopt the client's context, run the launch, report status"""
+    # The server ignores SIGCHLD to auto-reap; installer subprocesses need it back
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+
+    status = 1
+    try:
+        conn.sendall(REPLY_FIELD.pack(os.getpid()))
+        request, fds = _receive_request(conn)
+        if len(fds) != STDIO_FD_COUNT:
+            raise RuntimeError(f"expected {STDIO_FD_COUNT} descriptors, got {len(fds)}")
+
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        sys.stdin = open(0, closefd=False)
+        sys.stdout = open(1, "w", buffering=1, closefd=False)
+        sys.stderr = open(2, "w", buffering=1, closefd=False)
+
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+
+        try:
+            status = _exit_status(run(request["argv"]))
+        except SystemExit as e:
+            status = _exit_status(e.code)
+    except KeyboardInterrupt:
+        print("\n\nInstallation cancelled by user")
+    except Exception as e:
+        print(f"\n\nUnexpected error: {e}", file=sys.stderr)
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except (OSError, ValueError):
+                pass
+        try:
+            conn.sendall(REPLY_FIELD.pack(status))
+        except OSError:
+            pass
+        os._exit(status & 0xFF)
+
+
+def _bind_server(path: str) -> socket.socket:
+    """Bind the listening socket, replacing a stale one but not a live daemon"""
+    if os.path.exists(path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except OSError:
+            os.unlink(path)
+        else:
+            raise RuntimeError(f"launch daemon already running on {path}")
+        finally:
+            probe.close()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Owner-only socket: whoever connects can run the installer as us
+    old_umask = os.umask(0o177)
+    try:
+        server.bind(path)
+    finally:
+        os.umask(old_umask)
+    server.listen()
+    return server
+
+
+def serve(run, preload) -> int:
+    """Preload the installer, then fork a child for each forwarded launch"""
+    preload()
+    path = socket_path()
+    server = _bind_server(path)
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    print(f"Launch daemon listening on {path} (Ctrl-C to stop)")
+
+    try:
+        while True:
+            conn, _addr = server.accept()
+            # Buffered output would otherwise be written again by the child
+            sys.stdout.flush()
+            sys.stderr.flush()
+            if os.fork() == 0:
+                server.close()
+                _handle_launch(conn, run)
+            conn.close()
+    except KeyboardInterrupt:
+        print("\nLaunch daemon stopped")
+        return 0
+    finally:
+        server.close()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def forward(argv) -> Optional[int]:
+    """Run a launch in the daemon; None if no daemon of ours is listening"""
+    path = socket_path()
+    try:
+        if os.stat(path).st_uid != os.getuid():
+            return None
+    except OSError:
+        return None
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(path)
+    except OSError:
+        client.close()
+        return None
+
+    with client:
+        payload = json.dumps({
+            "argv": list(argv),
+            "cwd": os.getcwd(),
+            "env": dict(os.environ),
+        }).encode()
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        fds = array.array("i", range(STDIO_FD_COUNT))
+        sent = client.sendmsg(
+            [payload], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, fds)]
+        )
+        client.sendall(payload[sent:])
+        client.shutdown(socket.SHUT_WR)
+
+        reply = _recv_exact(client, REPLY_FIELD.size)
+        if len(reply) < REPLY_FIELD.size:
+            return 1
+        (child_pid,) = REPLY_FIELD.unpack(reply)
+
+        # The child is not in our process group, so pass Ctrl-C on by hand
+        while True:
+            try:
+                reply = _recv_exact(client, REPLY_FIELD.size)
+                break
+            except KeyboardInterrupt:
+                try:
+                    os.kill(child_pid, signal.SIGINT)
+                except OSError:
+                    pass
+
+    if len(reply) < REPLY_FIELD.size:
+        return 1
+    return REPLY_FIELD.unpack(reply)[0]